@@ -37,24 +37,30 @@ class ExampleObjFeats(ObjectFeaturesPlugin):
 
         P = 8
         R = 1
-        lbp_total = numpy.zeros(mask_both.shape)
+        hist_incl = numpy.zeros(P + 2)
+        hist_excl = numpy.zeros(P + 2)
+        hist_obj = numpy.zeros(P + 2)
 
         # LBPs are inherently 2D. For 3D data, loop over the z slices
         # This function always gets a 3D bounding box, for 2D data
         # the box will have a singleton dimension
+        # Histograms are accumulated per slice, so the LBP image is never stored for the whole box
         for iz in range(image.shape[axes.z]):
             # an lbp image
             bboxkey = [slice(None)] * 3
             bboxkey[axes.z] = iz
             bboxkey = tuple(bboxkey)
-            lbp_total[bboxkey] = ft.local_binary_pattern(rawbbox[bboxkey], P, R, "uniform")
-        # extract relevant parts
-        lbp_incl = lbp_total[mask_both]
-        lbp_excl = lbp_total[mask_neigh.astype(bool)]
-        lbp_obj = lbp_total[mask_object.astype(bool)]
-        lbp_hist_incl, _ = numpy.histogram(lbp_incl, normed=True, bins=(P + 2), range=(0, P + 2))
-        lbp_hist_excl, _ = numpy.histogram(lbp_excl, normed=True, bins=(P + 2), range=(0, P + 2))
-        lbp_hist_obj, _ = numpy.histogram(lbp_obj, normed=True, bins=(P + 2), range=(0, P + 2))
+            # uniform LBP codes are integers in [0, P + 1]
+            lbp_slice = ft.local_binary_pattern(rawbbox[bboxkey], P, R, "uniform").astype(numpy.uint8)
+            # extract relevant parts
+            hist_incl += numpy.bincount(lbp_slice[mask_both[bboxkey]], minlength=P + 2)
+            hist_excl += numpy.bincount(lbp_slice[mask_neigh[bboxkey]], minlength=P + 2)
+            hist_obj += numpy.bincount(lbp_slice[mask_object[bboxkey]], minlength=P + 2)
+
+        # bins have unit width, so normalizing by the count gives the density
+        lbp_hist_incl = hist_incl / hist_incl.sum()
+        lbp_hist_excl = hist_excl / hist_excl.sum()
+        lbp_hist_obj = hist_obj / hist_obj.sum()
 
         result = {}
         result["lbp" + self.local_out_suffixes[1]] = lbp_hist_incl
@@ -20,7 +20,6 @@
 ###############################################################################
 import logging
 import typing
-from collections import OrderedDict
 from functools import partial
 
 from PyQt5.QtCore import Qt
@@ -38,10 +37,8 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-import ilastik.config
 from ilastik.utility import log_exception
 from ilastik.utility.gui import ThreadRouter, threadRouted
-from ilastik.widgets.ImageFileDialog import ImageFileDialog
 from lazyflow.request import Request
 from ilastik.applets.base.applet import ShellRequest
 
@@ -52,17 +49,19 @@ class FileListWidget(QListWidget):
     """QListWidget with custom drag-n-drop for file paths"""
 
     def dropEvent(self, dropEvent):
-        urls = dropEvent.mimeData().urls()
+        paths = [qurl.toLocalFile() for qurl in dropEvent.mimeData().urls()]
         self.clear()
-        self.addItems(qurl.toLocalFile() for qurl in urls)
+        self.addItems(paths)
 
     def dragEnterEvent(self, event):
         # Only accept drag-and-drop events that consist of urls to local files.
-        if not event.mimeData().hasUrls():
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
             return
-        urls = event.mimeData().urls()
-        if all(url.isLocalFile() for url in urls):
-            event.acceptProposedAction()
+        for url in mime_data.urls():
+            if not url.isLocalFile():
+                return
+        event.acceptProposedAction()
 
     def dragMoveEvent(self, event):
         # Must override this or else the QTableView base class steals dropEvents from us.
@@ -107,19 +106,19 @@ class BatchRoleWidget(QWidget):
         Utility function.
         Return all items in the given QListWidget as a list of strings.
         """
-        all_item_strings = []
-        for row in range(self.list_widget.count()):
-            all_item_strings.append(self.list_widget.item(row).text())
-        return all_item_strings
+        list_widget = self.list_widget
+        return [list_widget.item(row).text() for row in range(list_widget.count())]
 
     def select_files(self):
+        from ilastik.widgets.ImageFileDialog import ImageFileDialog
+
         preference_name = f"recent-dir-role-{self._role_name}"
         file_paths = ImageFileDialog(
             self, preferences_group="BatchProcessing", preferences_setting=preference_name
         ).getSelectedPaths()
         if file_paths:
             self.clear()
-            self.list_widget.addItems(map(str, file_paths))
+            self.list_widget.addItems([str(path) for path in file_paths])
 
     def clear(self):
         """Remove all items from the list"""
@@ -171,13 +170,14 @@ class BatchProcessingGui(QTabWidget):
         self.threadRouter = ThreadRouter(self)
         self._drawer = None
         self._data_role_widgets = {}
+        self._role_names = tuple(parentApplet.dataSelectionApplet.role_names)
         self.initMainUi()
         self.initAppletDrawerUi()
         self.export_req = None
 
     def initMainUi(self):
         # Create a tab for each role
-        for role_name in self.parentApplet.dataSelectionApplet.role_names:
+        for role_name in self._role_names:
             assert role_name not in self._data_role_widgets
             data_role_widget = BatchRoleWidget(role_name=role_name, parent=self)
             self.addTab(data_role_widget, role_name)
@@ -208,10 +208,8 @@ class BatchProcessingGui(QTabWidget):
         self._drawer.setLayout(layout)
 
     def run_export(self):
-        role_names = self.parentApplet.dataSelectionApplet.role_names
-
-        # Prepare file lists in an OrderedDict
-        role_inputs = {role_name: self._data_role_widgets[role_name].filepaths for role_name in role_names}
+        # Prepare file lists for all roles
+        role_inputs = {role_name: self._data_role_widgets[role_name].filepaths for role_name in self._role_names}
         if all(len(role_inp) == 0 for role_inp in role_inputs.values()):
             return
         self.parentApplet.shellRequestSignal(ShellRequest.RequestSave)
@@ -26,6 +26,7 @@ from PyQt5.QtGui import QIcon
 import os.path
 
 FILEPATH = os.path.split(__file__)[0]
+ADD_ICON_PATH = os.path.join(FILEPATH, "..", "..", "shell", "gui", "icons", "16x16", "actions", "list-add.png")
 
 # Is DVID available?
 try:
@@ -61,7 +62,7 @@ class AddFileButton(QPushButton):
             corresponding to an existing lane (such as prediction maps)
         """
         super(AddFileButton, self).__init__(
-            QIcon(FILEPATH + "/../../shell/gui/icons/16x16/actions/list-add.png"),
+            QIcon(ADD_ICON_PATH),
             "Add..." if new == False else "Add New...",
             parent,
         )
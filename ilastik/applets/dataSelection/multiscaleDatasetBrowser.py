@@ -58,21 +58,23 @@ def _validate_uri(text: str) -> str:
     Returns a valid URI, or raises ValueError if invalid."""
     if text == "":
         raise ValueError('Please enter a path or URL, then press "Check".')
-    if not isUrl(text):
-        ospath = pathlib.Path(text)
-        if ospath.exists():  # It's a local file path - convert to file: URI
-            return ospath.as_uri()
-        else:  # Maybe the user typed the address manually and forgot https://?
-            raise ValueError('Please enter a URL including protocol ("http(s)://" or "file:").')
-    elif isUrl(text) and text.startswith("file:"):
-        # Check the file URI points to an existing path
-        try:
-            exists = uri_to_Path(text).exists()
-        except ValueError:  # from uri_to_Path
-            raise ValueError("Path is not absolute. Please try copy-pasting the full path.")
-        if not exists:
-            raise ValueError("Directory does not exist or URL is malformed. Please try copy-pasting the path directly.")
-    return text
+    if isUrl(text):
+        if text.startswith("file:"):
+            # Check the file URI points to an existing path
+            try:
+                exists = uri_to_Path(text).exists()
+            except ValueError:  # from uri_to_Path
+                raise ValueError("Path is not absolute. Please try copy-pasting the full path.")
+            if not exists:
+                raise ValueError(
+                    "Directory does not exist or URL is malformed. Please try copy-pasting the path directly."
+                )
+        return text
+    ospath = pathlib.Path(text)
+    if ospath.exists():  # It's a local file path - convert to file: URI
+        return ospath.as_uri()
+    else:  # Maybe the user typed the address manually and forgot https://?
+        raise ValueError('Please enter a URL including protocol ("http(s)://" or "file:").')
 
 
 class MultiscaleDatasetBrowser(QDialog):
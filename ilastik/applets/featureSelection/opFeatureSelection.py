@@ -22,6 +22,7 @@ import h5py
 import logging
 import numpy
 import sys
+from types import MappingProxyType
 
 # lazyflow
 from lazyflow.graph import Operator, InputSlot, OutputSlot
@@ -229,6 +230,13 @@ class OpFeatureSelection(OpFeatureSelectionNoCache):
     BypassCache = InputSlot(value=False)
     CachedOutputImage = OutputSlot()
 
+    # Slab-shaped cache blocks, one per viewing direction.
+    # Overestimate number of feature channels:
+    # Cache block dimensions will be clipped to the size of the actual feature image
+    _CACHE_BLOCK_DIMS_X = MappingProxyType({"t": 1, "c": 1000, "z": 256, "y": 256, "x": 32})
+    _CACHE_BLOCK_DIMS_Y = MappingProxyType({"t": 1, "c": 1000, "z": 256, "y": 32, "x": 256})
+    _CACHE_BLOCK_DIMS_Z = MappingProxyType({"t": 1, "c": 1000, "z": 32, "y": 256, "x": 256})
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -257,16 +265,10 @@ class OpFeatureSelection(OpFeatureSelectionNoCache):
             self.CachedOutputImage.meta.assignFrom(self.OutputImage.meta)
 
         else:
-            # Overestimate number of feature channels:
-            # Cache block dimensions will be clipped to the size of the actual feature image
-            blockDimsX = {"t": 1, "c": 1000, "z": 256, "y": 256, "x": 32}
-            blockDimsY = {"t": 1, "c": 1000, "z": 256, "y": 32, "x": 256}
-            blockDimsZ = {"t": 1, "c": 1000, "z": 32, "y": 256, "x": 256}
-
             axisOrder = self.InputImage.meta.getAxisKeys()
-            blockShapeX = tuple(blockDimsX[k] for k in axisOrder)
-            blockShapeY = tuple(blockDimsY[k] for k in axisOrder)
-            blockShapeZ = tuple(blockDimsZ[k] for k in axisOrder)
+            blockShapeX = tuple(self._CACHE_BLOCK_DIMS_X[k] for k in axisOrder)
+            blockShapeY = tuple(self._CACHE_BLOCK_DIMS_Y[k] for k in axisOrder)
+            blockShapeZ = tuple(self._CACHE_BLOCK_DIMS_Z[k] for k in axisOrder)
 
             # Configure the cache
             self.opPixelFeatureCache.BlockShape.setValue((blockShapeX, blockShapeY, blockShapeZ))
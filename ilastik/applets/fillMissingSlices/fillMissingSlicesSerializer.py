@@ -46,7 +46,7 @@ class FillMissingSlicesSerializer(AppletSerializer):
 
     ### internal ###
     def _setDataset(self, group, dataName, dataValue):
-        if dataName not in list(group.keys()):
+        if dataName not in group:
             # Create and assign
             group.create_dataset(dataName, data=dataValue)
         else:
@@ -18,7 +18,6 @@
 # on the ilastik web site at:
 #          http://ilastik.org/license.html
 ###############################################################################
-from functools import partial
 import numpy
 
 from lazyflow.graph import Operator, InputSlot, OutputSlot
@@ -190,20 +189,21 @@ class OpNNClassification(Operator):
 
         # All input multi-slots should be kept in sync
         # Output multi-slots will auto-sync via the graph
-        multiInputs = [s for s in list(self.inputs.values()) if s.level >= 1]
-        for s1 in multiInputs:
-            for s2 in multiInputs:
-                if s1 != s2:
+        multiInputs = tuple(s for s in self.inputs.values() if s.level >= 1)
 
-                    def insertSlot(a, b, position, finalsize):
-                        a.insertSlot(position, finalsize)
+        def insertSlot(source, position, finalsize):
+            for s in multiInputs:
+                if s is not source:
+                    s.insertSlot(position, finalsize)
 
-                    s1.notifyInserted(partial(insertSlot, s2))
+        def removeSlot(source, position, finalsize):
+            for s in multiInputs:
+                if s is not source:
+                    s.removeSlot(position, finalsize)
 
-                    def removeSlot(a, b, position, finalsize):
-                        a.removeSlot(position, finalsize)
-
-                    s1.notifyRemoved(partial(removeSlot, s2))
+        for s in multiInputs:
+            s.notifyInserted(insertSlot)
+            s.notifyRemoved(removeSlot)
 
     def set_model(self, model_content: bytes) -> bool:
         self.ModelBinary.disconnect()
@@ -230,13 +230,8 @@ class OpNNClassification(Operator):
         self.LabelInputs.resize(numImages)
 
         # Special case: We have to set up the shape of our label *input* according to our image input shape
-        shapeList = list(self.InputImages[imageIndex].meta.shape)
-        try:
-            channelIndex = self.InputImages[imageIndex].meta.axistags.index("c")
-            shapeList[channelIndex] = 1
-        except:
-            pass
-        self.LabelInputs[imageIndex].meta.shape = tuple(shapeList)
+        taggedShape = inputSlot.meta.getTaggedShape()
+        self.LabelInputs[imageIndex].meta.shape = tuple(1 if key == "c" else size for key, size in taggedShape.items())
         self.LabelInputs[imageIndex].meta.axistags = inputSlot.meta.axistags
 
     def _checkConstraints(self, laneIndex):
@@ -255,11 +250,6 @@ class OpNNClassification(Operator):
                 validShape = slot.meta.getTaggedShape()
                 break
 
-        if "t" in thisLaneTaggedShape:
-            del thisLaneTaggedShape["t"]
-        if "t" in validShape:
-            del validShape["t"]
-
         if validShape["c"] != thisLaneTaggedShape["c"]:
             raise DatasetConstraintError(
                 "Pixel Classification with CNNs",
@@ -269,12 +259,15 @@ class OpNNClassification(Operator):
                 ),
             )
 
-        if len(validShape) != len(thisLaneTaggedShape):
+        # Time is ignored when comparing dimensionality
+        thisLaneNdim = len(thisLaneTaggedShape) - ("t" in thisLaneTaggedShape)
+        validNdim = len(validShape) - ("t" in validShape)
+        if validNdim != thisLaneNdim:
             raise DatasetConstraintError(
                 "Pixel Classification with CNNs",
                 "All input images must have the same dimensionality.  "
                 "Your new image has {} dimensions (including channel), but your other images have {} dimensions.".format(
-                    len(thisLaneTaggedShape), len(validShape)
+                    thisLaneNdim, validNdim
                 ),
             )
 
@@ -314,13 +307,10 @@ class OpNNClassification(Operator):
             # FIXME: take the colors from default16_new
             from volumina import colortables
 
-            default_colors = colortables.default16_new
+            new_colors = colortables.default16_new[old_max:new_max]
 
-            label_colors = self.LabelColors.value
-            pmap_colors = self.PmapColors.value
-
-            self.LabelColors.setValue(label_colors + default_colors[old_max:new_max])
-            self.PmapColors.setValue(pmap_colors + default_colors[old_max:new_max])
+            self.LabelColors.setValue(self.LabelColors.value + new_colors)
+            self.PmapColors.setValue(self.PmapColors.value + new_colors)
 
     def mergeLabels(self, from_label, into_label):
         for laneIndex in range(len(self.InputImages)):
@@ -338,10 +328,16 @@ class OpBlockShape(Operator):
     BlockShapeTrain = OutputSlot()
     BlockShapeInference = OutputSlot()
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (model session, axis order, block shape) of the last setup_inference call
+        self._inferenceBlockShape = None
+
     def setupOutputs(self):
         if self.ModelSession.value is _NO_MODEL:
             self.BlockShapeTrain.meta.NOTREADY = True
             self.BlockShapeInference.meta.NOTREADY = True
+            self._inferenceBlockShape = None
             return
         self.BlockShapeTrain.setValue(self.setup_train())
         self.BlockShapeInference.setValue(self.setup_inference())
@@ -371,6 +367,11 @@ class OpBlockShape(Operator):
 
     def setup_inference(self):
         tikmodel: ModelSession = self.ModelSession.value
+        axisOrder = self.RawImage.meta.getAxisKeys()
+        cached = self._inferenceBlockShape
+        if cached is not None and cached[0] is tikmodel and cached[1] == axisOrder:
+            return cached[2]
+
         input_names = tikmodel.input_names
         assert len(input_names) == 1, "This op can only handle models with a single input tensor."
         valid_tczyx_shapes = tikmodel.get_input_shapes(axes="tczyx")[input_names[0]]
@@ -384,7 +385,6 @@ class OpBlockShape(Operator):
 
         blockDims = dict(zip("tczyx", largest_valid_shape))
         blockDims["c"] = tikmodel.num_classes  # always request all channels
-        axisOrder = self.RawImage.meta.getAxisKeys()
         ret = tuple(blockDims[a] for a in axisOrder)
         logger.debug(
             "got largest valid shape %s and axis order %s => Set BlockShapeInference to %s",
@@ -392,6 +392,7 @@ class OpBlockShape(Operator):
             axisOrder,
             ret,
         )
+        self._inferenceBlockShape = (tikmodel, axisOrder, ret)
         return ret
 
     def execute(self, slot, subindex, roi, result):
@@ -416,12 +417,6 @@ class OpPredictionPipeline(Operator):
     def __init__(self, *args, **kwargs):
         super(OpPredictionPipeline, self).__init__(*args, **kwargs)
 
-        self.cacheless_predict = OpTikTorchClassifierPredict(parent=self)
-        self.cacheless_predict.name = "OpTiktorchClassifierPredict (Cacheless Path)"
-        self.cacheless_predict.ModelSession.connect(self.Classifier)
-        self.cacheless_predict.Image.connect(self.RawImage)  # <--- Not from cache
-        self.cacheless_predict.LabelsCount.connect(self.NumClasses)
-
         self.predict = OpTikTorchClassifierPredict(parent=self)
         self.predict.name = "OpTiktorchClassifierPredict"
         self.predict.ModelSession.connect(self.Classifier)
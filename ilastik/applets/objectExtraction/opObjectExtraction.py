@@ -106,10 +106,10 @@ def make_bboxes(binary_bbox, margin):
         dt = dt.reshape(dt.shape + (1,))
 
     assert dt.ndim == 3
-    passed = numpy.asarray(dt < max_margin).astype(bool)
+    passed = numpy.asarray(dt < max_margin)
 
     # context only
-    context = numpy.asarray(passed) ^ numpy.asarray(binary_bbox).astype(bool)
+    context = passed & ~numpy.asarray(binary_bbox, dtype=bool)
     return passed, context
 
 
@@ -212,12 +212,19 @@ class OpAdaptTimeListRoi(Operator):
         # Get time ranges with consecutive numbers
         time_ranges = [list(g) for _, g in groupby(roi, key=lambda n, c=count(): n - next(c))]
 
-        result = {}
+        # Request all time ranges in parallel
+        requests = []
         for time_range in time_ranges:
             start = [time_range[0]]
             stop = [time_range[-1] + 1]
 
-            val = self.Input(start, stop).wait()
+            req = self.Input(start, stop)
+            req.submit()
+            requests.append((time_range, req))
+
+        result = {}
+        for time_range, req in requests:
+            val = req.wait()
 
             for i, t in enumerate(time_range):
                 result[t] = val[i]
@@ -243,18 +250,6 @@ class OpObjectCenterImage(Operator):
     def setupOutputs(self):
         self.Output.meta.assignFrom(self.BinaryImage.meta)
 
-    @staticmethod
-    def __contained_in_subregion(roi, coords):
-        b = True
-        for i in range(len(coords)):
-            b = b and (roi.start[i] <= coords[i] and coords[i] < roi.stop[i])
-        return b
-
-    @staticmethod
-    def __make_key(roi, coords):
-        key = [int(coords[i] - roi.start[i]) for i in range(len(roi.start))]
-        return tuple(key)
-
     def execute(self, slot, subindex, roi, result):
         assert slot == self.Output, "Unknown output slot"
 
@@ -263,22 +258,22 @@ class OpObjectCenterImage(Operator):
         taggedShape = self.BinaryImage.meta.getTaggedShape()
         if "z" not in taggedShape or taggedShape["z"] == 1:
             ndim = 2
+        # FIXME: this assumes txyzc axis order
+        start = numpy.asarray(roi.start[1:4])
+        stop = numpy.asarray(roi.stop[1:4])
         for t in range(roi.start[0], roi.stop[0]):
             obj_features = self.RegionCenters([t]).wait()
-            # FIXME: this assumes that channel is the last axis
-            for ch in range(roi.start[-1], roi.stop[-1]):
-                centers = obj_features[t][default_features_key]["RegionCenter"]
-                if centers.size:
-                    centers = centers[1:, :]
-                for center in centers:
-                    if ndim == 3:
-                        x, y, z = center[0:3]
-                        c = (t, x, y, z, ch)
-                    elif ndim == 2:
-                        x, y = center[0:2]
-                        c = (t, x, y, 0, ch)
-                    if self.__contained_in_subregion(roi, c):
-                        result[self.__make_key(roi, c)] = 1
+            centers = obj_features[t][default_features_key]["RegionCenter"]
+            if not centers.size:
+                continue
+
+            # skip the background object, 2D centers lie in the z=0 plane
+            coords = numpy.zeros((centers.shape[0] - 1, 3))
+            coords[:, :ndim] = centers[1:, :ndim]
+            inside = numpy.all((start <= coords) & (coords < stop), axis=1)
+            key = (coords[inside] - start).astype(int)
+            # centers do not depend on the channel, mark them in all requested channels
+            result[t - roi.start[0], key[:, 0], key[:, 1], key[:, 2], :] = 1
 
         return result
 
@@ -708,29 +703,33 @@ class OpRegionFeatures(Operator):
                 plugin = pluginManager.getPluginByName(plugin_name, "ObjectFeatures")
                 tmp_dicts = [None] * nobj
 
-                def _calc_single(i, raw_bbox, binary_bbox):
-                    feats = plugin.plugin_object.compute_local(raw_bbox, binary_bbox, feature_dict, axes)
-                    tmp_dicts[i] = feats
+                def _calc_single(i):
+                    logger.debug("processing object %d", i)
+                    # Bounding boxes are extracted in the request as well, so that
+                    # building the binary masks is spread over the workers, too.
+                    if i not in bboxes:
+                        extent = self.compute_extent(i, image, mincoords, maxcoords, axes, margin)
+                        raw_bbox = self.compute_rawbbox(image, extent, axes)
+                        # it's i+1 here, because the background has label 0
+                        binary_bbox = labels[tuple(extent)] == i + 1
+                        bboxes[i] = (raw_bbox, binary_bbox)
+
+                    raw_bbox, binary_bbox = bboxes[i]
+                    tmp_dicts[i] = plugin.plugin_object.compute_local(raw_bbox, binary_bbox, feature_dict, axes)
 
                 with RequestPool() as pool:
                     # starting from 0, we stripped 0th background object in global computation
                     for i in range(nobj):
-                        logger.debug("processing object {}".format(i))
-                        if i not in bboxes:
-                            extent = self.compute_extent(i, image, mincoords, maxcoords, axes, margin)
-                            raw_bbox = self.compute_rawbbox(image, extent, axes)
-                            # it's i+1 here, because the background has label 0
-                            binary_bbox = labels[tuple(extent)] == i + 1
-                            bboxes[i] = (raw_bbox, binary_bbox)
-
-                        raw_bbox, binary_bbox = bboxes[i]
-                        pool.add(Request(partial(_calc_single, i, raw_bbox, binary_bbox)))
+                        pool.add(Request(partial(_calc_single, i)))
 
                 # merge the results
                 for feature_dict in tmp_dicts:
                     for feature_name, features in feature_dict.items():
                         local_features[plugin_name][feature_name].append(features)
 
+            # release the per-object binary masks before the features are stacked
+            del bboxes
+
         logger.debug("computing done, removing failures")
         # remove local features that failed
         for pname, pfeats in local_features.items():
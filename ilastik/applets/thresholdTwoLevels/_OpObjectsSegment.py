@@ -173,7 +173,7 @@ class OpObjectsSegment(OpGraphCut):
         resultZYX = vigra.taggedView(np.zeros(cc.shape, dtype=np.uint8), axistags="zyx")
 
         def processSingleObject(i):
-            logger.debug("processing object {}".format(i))
+            logger.debug("processing object %d", i)
             # maxs are inclusive, so we need to add 1
             zmin = max(mins[i][0] - margin_zyx[0], 0)
             ymin = max(mins[i][1] - margin_zyx[1], 0)
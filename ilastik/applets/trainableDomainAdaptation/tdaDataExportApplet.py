@@ -42,6 +42,10 @@ class TdaDataExportApplet(DataExportApplet):
         # Base class init
         super().__init__(workflow, title, isBatch)
 
+    @property
+    def dataSerializers(self):
+        return self._serializers
+
     @property
     def topLevelOperator(self):
         return self._topLevelOperator
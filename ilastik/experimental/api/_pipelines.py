@@ -126,7 +126,7 @@ class PixelClassificationPipeline:
                 f"Number of channels mismatch. Classifier trained for {self._num_channels} but input has {num_channels_in_data}"
             )
 
-        num_spatial_in_data = sum(a.isSpatial() for a in raw_data.axistags)
+        num_spatial_in_data = raw_data.axistags.axisTypeCount(vigra.AxisType.Space)
         if num_spatial_in_data != self._num_spatial_dims:
             raise ValueError(
                 "Number of spatial dims doesn't match. "
@@ -232,7 +232,7 @@ class AutocontextPipeline:
                 f"Number of channels mismatch. Classifier trained for {self._num_channels} but input has {num_channels_in_data}"
             )
 
-        num_spatial_in_data = sum(a.isSpatial() for a in raw_data.axistags)
+        num_spatial_in_data = raw_data.axistags.axisTypeCount(vigra.AxisType.Space)
         if num_spatial_in_data != self._num_spatial_dims:
             raise ValueError(
                 "Number of spatial dims doesn't match. "
@@ -239,11 +239,14 @@ class VigraObjFeats(ObjectFeaturesPlugin):
     def _do_4d(self, image, labels, features, axes):
         if self.ndim == 2:
             result = vigra.analysis.extractRegionFeatures(
-                image.squeeze().astype(np.float32), labels.squeeze().astype(np.uint32), features, ignoreLabel=0
+                image.squeeze().astype(np.float32, copy=False),
+                labels.squeeze().astype(np.uint32),
+                features,
+                ignoreLabel=0,
             )
         else:
             result = vigra.analysis.extractRegionFeatures(
-                image.astype(np.float32), labels.astype(np.uint32), features, ignoreLabel=0
+                image.astype(np.float32, copy=False), labels.astype(np.uint32), features, ignoreLabel=0
             )
 
         # take a non-global feature
@@ -291,6 +294,8 @@ class VigraObjFeats(ObjectFeaturesPlugin):
         passed, excl = ilastik.applets.objectExtraction.opObjectExtraction.make_bboxes(binary_bbox, margin)
         # assert np.all(passed==excl)==False
         # assert np.all(binary_bbox+excl==passed)
+        # convert once, both label images are evaluated on the same raw data
+        image = image.astype(np.float32, copy=False)
         for label, suffix in zip([excl, passed], self.local_out_suffixes):
             result = self._do_4d(image, label, featurenames, axes)
             results.append(self.update_keys(result, suffix=suffix))
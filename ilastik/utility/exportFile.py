@@ -151,21 +151,19 @@ def flatten_ilastik_feature_table(table, selection, signal):
 
     signal(75)
 
+    # Resolve the source of every column once; the field views write through to feature_table
+    columns = [(feature_table[name],) + dtype_to_key[name] for name in dtype_names]
+
     start = 0
-    end = obj_count[0]
-    for t, cf in computed_feature.items():
-        for name in dtype_names:
-            plugin, feat_name, index = dtype_to_key[name]
+    for count, cf in zip(obj_count, computed_feature.values()):
+        stop = start + count
+        for column, plugin, feat_name, index in columns:
             # HACK: there could be time frames with 0 objects - which will result in
             # the features names not being present in cf.
             if feat_name in cf[plugin]:
-                data_len = len(cf[plugin][feat_name][1:, index])
-                feature_table[name][start : start + data_len] = cf[plugin][feat_name][1:, index]
-        start = end
-        try:
-            end += obj_count[int(t) + 1]
-        except IndexError:
-            end = sum(obj_count)
+                data = cf[plugin][feat_name][1:, index]
+                column[start : start + len(data)] = data
+        start = stop
 
     signal(100)
 
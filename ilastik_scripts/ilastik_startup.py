@@ -1,17 +1,28 @@
 import ctypes.util
+import fnmatch
 import logging
 import os
 import pathlib
 import platform
+import re
 import shlex
 import ssl
 import sys
 import warnings
-from typing import Iterable, Mapping, Sequence, Tuple, Union
+from typing import Iterable, List, Mapping, Sequence, Tuple, Union
 
 
 logger = logging.getLogger(__name__)
 
+# Elements of PATH that are kept on Windows; arbitrary nesting within those directories is allowed.
+_WIN_PATH_RE = re.compile(
+    "|".join(
+        fnmatch.translate(pattern)
+        for pattern in ("*/cplex_studio*/?*", "*/gurobi*/?*", "/windows/system32/?*/?*", "?:/windows/system32/?*/?*")
+    ),
+    re.IGNORECASE,
+)
+
 
 def _env_list(name: str, sep: str = os.pathsep) -> Iterable[str]:
     """Items from the environment variable, delimited by separator.
@@ -25,25 +36,23 @@ def _env_list(name: str, sep: str = os.pathsep) -> Iterable[str]:
 
 
 def _clean_paths(root: pathlib.Path) -> None:
+    root_str = os.fspath(root)
+    norm_root = os.path.normcase(os.path.normpath(root_str))
+    root_prefix = norm_root if norm_root.endswith(os.sep) else norm_root + os.sep
+
     def issubdir(path):
         """Whether path is equal to or is a subdirectory of root."""
-        path = pathlib.PurePath(path)
-        return path == root or any(parent == root for parent in path.parents)
+        path = os.path.normcase(os.path.normpath(path))
+        return path == norm_root or path.startswith(root_prefix)
 
     def subdirs(*suffixes):
         """Valid subdirectories of root."""
-        paths = map(root.joinpath, suffixes)
-        return [str(p) for p in paths if p.is_dir()]
+        paths = (os.path.normpath(os.path.join(root_str, suffix)) for suffix in suffixes)
+        return [p for p in paths if os.path.isdir(p)]
 
     def isvalidpath_win(path):
         """Whether an element of PATH is "clean" on Windows."""
-
-        def partial_match(path, pattern):
-            """allow arbitrary nesting within those patterns"""
-            return any(p.match(pattern) for p in path.parents)
-
-        patterns = "**/cplex_studio*", "**/gurobi*", "/windows/system32/*"
-        return any(partial_match(pathlib.PurePath(path), pat) for pat in patterns)
+        return _WIN_PATH_RE.match(path.replace("\\", "/")) is not None
 
     # Remove undesired paths from PYTHONPATH and add ilastik's submodules.
     sys_path = list(filter(issubdir, sys.path))
@@ -54,13 +63,42 @@ def _clean_paths(root: pathlib.Path) -> None:
         # Empty PATH except for gurobi and CPLEX and add ilastik's installation paths.
         path = list(filter(isvalidpath_win, _env_list("PATH")))
         path += subdirs("Library/bin", "Library/mingw-w64/bin", "python", "bin")
-        os.environ["PATH"] = os.pathsep.join(reversed(path))
+        os.environ["PATH"] = os.pathsep.join(path[::-1])
     else:
         # Clean LD_LIBRARY_PATH and add ilastik's installation paths
         # (gurobi and CPLEX are supposed to be located there as well).
         ld_lib_path = list(filter(issubdir, _env_list("LD_LIBRARY_PATH")))
         ld_lib_path += subdirs("lib")
-        os.environ["LD_LIBRARY_PATH"] = os.pathsep.join(reversed(ld_lib_path))
+        os.environ["LD_LIBRARY_PATH"] = os.pathsep.join(ld_lib_path[::-1])
+
+
+def _split_config_options(text: str) -> List[str]:
+    """Split the config text into shell-like tokens, ignoring comments.
+
+    Only lines with quotes or escapes go through shlex, all others are split on whitespace.
+    A quoted value that is not closed on its line is joined with the following lines.
+    """
+    opts = []
+    pending = ""
+    for line in text.split("\n"):
+        if pending:
+            line = f"{pending}\n{line}"
+        elif not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if "'" in line or '"' in line or "\\" in line:
+            try:
+                opts += shlex.split(line, comments=True)
+            except ValueError:
+                # Unclosed quotation or trailing escape, the value continues on the next line
+                pending = line
+            else:
+                pending = ""
+        else:
+            opts += line.split("#", 1)[0].split()
+    if pending:
+        # Raises for a quotation that is never closed
+        opts += shlex.split(pending, comments=True)
+    return opts
 
 
 def _parse_internal_config(path: Union[str, os.PathLike]) -> Tuple[Sequence[str], Mapping[str, str]]:
@@ -77,10 +115,12 @@ def _parse_internal_config(path: Union[str, os.PathLike]) -> Tuple[Sequence[str]
         ValueError: Config file is malformed.
     """
     path = pathlib.Path(path)
-    if not path.exists():
+    try:
+        text = path.read_text()
+    except (FileNotFoundError, NotADirectoryError):
         return [], {}
 
-    opts = shlex.split(path.read_text(), comments=True)
+    opts = _split_config_options(text)
 
     sep_idx = tuple(i for i, opt in enumerate(opts) if opt.startswith(";"))
     if len(sep_idx) != 1:
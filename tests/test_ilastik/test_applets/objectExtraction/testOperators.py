@@ -28,7 +28,13 @@ import numpy as np
 import vigra
 from lazyflow.graph import Graph
 from lazyflow.operators import OpLabelVolume
-from ilastik.applets.objectExtraction.opObjectExtraction import OpAdaptTimeListRoi, OpRegionFeatures, OpObjectExtraction
+from ilastik.applets.objectExtraction.opObjectExtraction import (
+    OpAdaptTimeListRoi,
+    OpObjectCenterImage,
+    OpRegionFeatures,
+    OpObjectExtraction,
+    default_features_key,
+)
 from ilastik.plugins.manager import pluginManager
 
 import warnings
@@ -140,6 +146,71 @@ class TestPlugins(unittest.TestCase):
         feats = self.op.RegionFeatures([0]).wait()
 
 
+def regionCenters(centers_per_frame):
+    """Features as provided by OpObjectExtraction.RegionFeatures, first row is the background object"""
+    return {
+        t: {default_features_key: {"RegionCenter": np.asarray(centers, dtype=np.float32)}}
+        for t, centers in enumerate(centers_per_frame)
+    }
+
+
+class TestOpObjectCenterImage(unittest.TestCase):
+    def setUp(self):
+        self.op = OpObjectCenterImage(graph=Graph())
+
+    def setBinaryImage(self, shape):
+        img = vigra.VigraArray(shape, dtype=np.uint8, axistags=vigra.defaultAxistags("txyzc"))
+        self.op.BinaryImage.setValue(img)
+
+    def test_3d(self):
+        self.setBinaryImage((3, 10, 10, 10, 2))
+        self.op.RegionCenters.setValue(
+            regionCenters(
+                [
+                    [[0, 0, 0], [2.7, 3.2, 4.9], [8.0, 1.0, 9.5]],
+                    # only the background object
+                    [[0, 0, 0]],
+                    [[0, 0, 0], [5.5, 5.5, 5.5], [9.2, 2.0, 4.0], [3.9, 2.0, 4.0]],
+                ]
+            )
+        )
+
+        expected = np.zeros((3, 10, 10, 10, 2), dtype=np.uint8)
+        expected[0, 2, 3, 4, :] = 1
+        expected[0, 8, 1, 9, :] = 1
+        expected[2, 5, 5, 5, :] = 1
+        expected[2, 9, 2, 4, :] = 1
+        expected[2, 3, 2, 4, :] = 1
+        np.testing.assert_array_equal(self.op.Output[:].wait(), expected)
+
+        # offset roi in time and space, single channel
+        result = self.op.Output[1:3, 4:9, :, 3:10, 1:2].wait()
+        np.testing.assert_array_equal(result, expected[1:3, 4:9, :, 3:10, 1:2])
+        assert result.sum() == 1
+        assert result[1, 1, 5, 2, 0] == 1
+
+    def test_2d(self):
+        self.setBinaryImage((2, 10, 10, 1, 1))
+        self.op.RegionCenters.setValue(
+            regionCenters(
+                [
+                    [[0, 0], [1.5, 2.5], [7.0, 8.0]],
+                    [[0, 0], [4.2, 6.9]],
+                ]
+            )
+        )
+
+        expected = np.zeros((2, 10, 10, 1, 1), dtype=np.uint8)
+        expected[0, 1, 2, 0, 0] = 1
+        expected[0, 7, 8, 0, 0] = 1
+        expected[1, 4, 6, 0, 0] = 1
+        np.testing.assert_array_equal(self.op.Output[:].wait(), expected)
+
+        result = self.op.Output[1:2, 3:10, 5:10, :, :].wait()
+        np.testing.assert_array_equal(result, expected[1:2, 3:10, 5:10, :, :])
+        assert result[0, 1, 1, 0, 0] == 1
+
+
 class TestOpRegionFeaturesAgainstNumpy(unittest.TestCase):
     def setUp(self):
         g = Graph()
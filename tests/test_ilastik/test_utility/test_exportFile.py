@@ -1,8 +1,11 @@
+from unittest import mock
+
 import h5py
 import numpy as np
 import pytest
 
-from ilastik.utility.exportFile import ExportFile, Mode, create_slicing
+from ilastik.applets.objectExtraction.opObjectExtraction import default_features_key
+from ilastik.utility.exportFile import ExportFile, Mode, create_slicing, flatten_ilastik_feature_table
 
 
 class TestCreateSlicing:
@@ -62,3 +65,45 @@ def test_table_to_large_raises(tmp_path):
 
     with pytest.raises(ValueError):
         export_file.write_all(mode="h5")
+
+
+def test_flatten_ilastik_feature_table():
+    def features(*rows):
+        # First row is the background object
+        return np.array([[0] * len(rows[0])] + list(rows), dtype=np.float32)
+
+    computed_feature = {
+        0: {
+            default_features_key: {"Count": features([5], [7]), "RegionCenter": features([1, 2], [3, 4])},
+            "Test Features": {"Mean": features([1, 2, 3], [4, 5, 6])},
+        },
+        # Local features are not computed for frames without objects
+        1: {
+            default_features_key: {"Count": np.zeros((1, 1), dtype=np.float32), "RegionCenter": np.zeros((1, 2))},
+            "Test Features": {},
+        },
+        2: {
+            default_features_key: {"Count": features([9]), "RegionCenter": features([5, 6])},
+            "Test Features": {"Mean": features([7, 8, 9])},
+        },
+    }
+    table = mock.Mock()
+    table.meta.shape = (len(computed_feature),)
+    table.return_value.wait.return_value = computed_feature
+
+    feature_table = flatten_ilastik_feature_table(table, ["Mean"], lambda progress: None)
+
+    assert feature_table.dtype.names == (
+        "Size in pixels",
+        "Center of the object_0",
+        "Center of the object_1",
+        "Mean_0",
+        "Mean_1",
+        "Mean_2",
+    )
+    np.testing.assert_array_equal(feature_table["Size in pixels"], [5, 7, 9])
+    np.testing.assert_array_equal(feature_table["Center of the object_0"], [1, 3, 5])
+    np.testing.assert_array_equal(feature_table["Center of the object_1"], [2, 4, 6])
+    np.testing.assert_array_equal(feature_table["Mean_0"], [1, 4, 7])
+    np.testing.assert_array_equal(feature_table["Mean_1"], [2, 5, 8])
+    np.testing.assert_array_equal(feature_table["Mean_2"], [3, 6, 9])
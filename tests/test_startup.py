@@ -1,8 +1,11 @@
 import os
 import platform
 import ssl
+import sys
 
-from ilastik_scripts.ilastik_startup import fix_ssl
+import pytest
+
+from ilastik_scripts.ilastik_startup import _clean_paths, _parse_internal_config, fix_ssl
 
 
 def test_startup_ssl_paths():
@@ -18,3 +21,73 @@ def test_startup_ssl_paths():
     default_file_exists = os.path.isfile(ssl.get_default_verify_paths().openssl_cafile)
     override_file_exists = os.path.isfile(os.environ.get("SSL_CERT_FILE", ""))
     assert WIN or default_file_exists or override_file_exists
+
+
+def test_parse_internal_config(tmp_path):
+    config = tmp_path / "internal-startup-options.cfg"
+    config.write_text(
+        "## Comment with 'quotes'\n"
+        "LAZYFLOW_THREADS=42  # trailing comment\n"
+        "#LAZYFLOW_TOTAL_RAM_MB=8192\n"
+        ";;\n"
+        "--headless --project 'My Project.ilp'\n"
+        "#--workflow 'Pixel Classification'\n"
+        "raw_input.h5/volumes/data\n"
+    )
+    opts, env_vars = _parse_internal_config(config)
+    assert list(opts) == ["--headless", "--project", "My Project.ilp", "raw_input.h5/volumes/data"]
+    assert env_vars == {"LAZYFLOW_THREADS": "42"}
+
+
+def test_parse_internal_config_multiline_quote(tmp_path):
+    config = tmp_path / "internal-startup-options.cfg"
+    config.write_text("LAZYFLOW_THREADS=42\n;\n--project 'My\nProject.ilp' --headless\n")
+    opts, env_vars = _parse_internal_config(config)
+    assert list(opts) == ["--project", "My\nProject.ilp", "--headless"]
+    assert env_vars == {"LAZYFLOW_THREADS": "42"}
+
+
+def test_parse_internal_config_trailing_escaped_space(tmp_path):
+    config = tmp_path / "internal-startup-options.cfg"
+    config.write_text("LAZYFLOW_THREADS=42\n;\n--project My\\ \n--headless 'My \nProject.ilp'\n")
+    opts, env_vars = _parse_internal_config(config)
+    assert list(opts) == ["--project", "My ", "--headless", "My \nProject.ilp"]
+    assert env_vars == {"LAZYFLOW_THREADS": "42"}
+
+
+def test_parse_internal_config_missing_file(tmp_path):
+    opts, env_vars = _parse_internal_config(tmp_path / "does-not-exist.cfg")
+    assert not opts
+    assert not env_vars
+
+
+def test_parse_internal_config_requires_single_separator(tmp_path):
+    config = tmp_path / "internal-startup-options.cfg"
+    config.write_text("LAZYFLOW_THREADS=42\n--headless\n")
+    with pytest.raises(ValueError):
+        _parse_internal_config(config)
+
+
+def test_parse_internal_config_parent_is_file(tmp_path):
+    parent = tmp_path / "not-a-directory"
+    parent.write_text("")
+    opts, env_vars = _parse_internal_config(parent / "internal-startup-options.cfg")
+    assert not opts
+    assert not env_vars
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="LD_LIBRARY_PATH is only cleaned on Linux and macOS")
+def test_clean_paths(tmp_path, monkeypatch):
+    root = tmp_path / "ilastik-release"
+    (root / "lib").mkdir(parents=True)
+    (root / "ilastik" / "ilastik").mkdir(parents=True)
+    inside = str(root / "lib" / "python3")
+    sibling = str(tmp_path / "ilastik-release-other")
+
+    monkeypatch.setattr(sys, "path", [inside, sibling, str(root), "/usr/lib/python3"])
+    monkeypatch.setenv("LD_LIBRARY_PATH", os.pathsep.join([sibling, str(root / "lib" / "gurobi"), "/usr/lib"]))
+
+    _clean_paths(root)
+
+    assert sys.path == [inside, str(root), str(root / "ilastik" / "ilastik")]
+    assert os.environ["LD_LIBRARY_PATH"] == os.pathsep.join([str(root / "lib"), str(root / "lib" / "gurobi")])